@@ -1,27 +1,35 @@
+import hashlib
+import time
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from database.database import get_session
 from models.user import User as UserModel
 from schemas.user import UserResponse
 from auth.auth import decode_token
-from typing import Optional
+from typing import Optional, Union
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
+# Recently verified tokens, keyed by a digest of the token, mapped to (user, exp);
+# the TTL bounds how long a cached user may outlive a change to the account
+_TOKEN_CACHE: TTLCache = TTLCache(maxsize=10000, ttl=60)
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_session)
-) -> UserResponse:
-    """Extract and validate user from JWT token."""
+
+async def _resolve_user(
+    payload: Optional[dict],
+    db: Optional[AsyncSession] = None,
+    revalidate: bool = False
+) -> Union[UserResponse, UserModel]:
+    """Resolve the user from decoded JWT claims, or from the database when revalidate is set."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    payload = decode_token(token)
     if payload is None:
         raise credentials_exception
 
@@ -33,20 +41,54 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
-    if user is None:
+    if revalidate:
+        user = (await db.exec(select(UserModel).where(UserModel.id == user_id))).first()
+        if user is None:
+            raise credentials_exception
+        return user
+
+    # The token is signed, so the profile claims embedded at login can be trusted as-is
+    created_at = payload.get("cat")
+    if created_at is None:
         raise credentials_exception
 
-    # Convert to UserResponse format
     return UserResponse(
-        id=user.id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        created_at=user.created_at
+        id=user_id,
+        email=email,
+        first_name=payload.get("fn"),
+        last_name=payload.get("ln"),
+        created_at=created_at
     )
 
 
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
+    """Extract and validate user from JWT token without a database round-trip."""
+    # Runs on the event loop thread, so the cache needs no lock
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        user, expires_at = cached
+        # An entry must not outlive the token's own exp claim
+        if time.time() < expires_at:
+            return user
+        _TOKEN_CACHE.pop(key, None)
+
+    payload = decode_token(token)
+    user = await _resolve_user(payload)
+    # Tokens without an exp claim are resolved on every request rather than cached
+    if "exp" in payload:
+        _TOKEN_CACHE[key] = (user, payload["exp"])
+    return user
+
+
+async def get_current_user_revalidated(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_session)
+) -> UserModel:
+    """Extract user from JWT token and confirm it still exists in the database (for sensitive mutations)."""
+    return await _resolve_user(decode_token(token), db, revalidate=True)
+
+
 def get_current_active_user(current_user: UserResponse = Depends(get_current_user)) -> UserResponse:
     """Get the current active user (placeholder for future activation checks)."""
     # In the future, you could check if user.is_active == True
@@ -0,0 +1,37 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from database.config import get_settings
+
+settings = get_settings()
+
+# Configure argon2-cffi (libargon2) once at import and share it between signup and login;
+# verification reads the parameters stored in each hash, so changing them keeps old hashes valid
+PASSWORD_HASHER = PasswordHasher(
+    time_cost=settings.ARGON2_TIME_COST,
+    memory_cost=settings.ARGON2_MEMORY_COST,
+    parallelism=settings.ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
+
+# Dedicated pool for CPU-bound password hashing, so Argon2 doesn't block the event loop;
+# each hash already runs one thread per lane, so the workers share the cores between them
+HASH_POOL = ThreadPoolExecutor(
+    max_workers=max(1, (os.cpu_count() or 1) // settings.ARGON2_PARALLELISM),
+    thread_name_prefix="password-hash"
+)
+
+
+def hash_password(plain_password: str) -> str:
+    """Hash a password with Argon2."""
+    return PASSWORD_HASHER.hash(plain_password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against an Argon2 hash."""
+    try:
+        return PASSWORD_HASHER.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
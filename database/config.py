@@ -1,3 +1,5 @@
+from functools import lru_cache
+from pydantic import Field
 from pydantic_settings import SettingsConfigDict, BaseSettings
 from typing import Optional
 import os
@@ -10,10 +12,13 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-here")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536  # KiB
+    # Lanes libargon2 fills on separate threads; same memory cost, lower latency on multi-core hosts
+    ARGON2_PARALLELISM: int = Field(default_factory=lambda: min(4, os.cpu_count() or 1))
 
 
-settings = Settings()
-
-
-def get_settings():
-    return settings
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, read once per process; modules copy values at import, so changes need a restart"""
+    return Settings()
\ No newline at end of file
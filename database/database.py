@@ -1,29 +1,90 @@
-from sqlalchemy import create_engine
-from sqlalchemy.pool import QueuePool
-from sqlmodel import Session, SQLModel
-from .config import settings
-from typing import Generator
+from sqlalchemy import DateTime, inspect, make_url
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from .config import get_settings
+from typing import AsyncGenerator
 
 
+settings = get_settings()
+
+# Map the configured sync drivers to their asyncio counterparts
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_url(database_url: str) -> tuple[URL, dict]:
+    """Translate DATABASE_URL into an asyncio driver URL plus its connect_args"""
+    url = make_url(database_url)
+    url = url.set(drivername=ASYNC_DRIVERS.get(url.drivername, url.drivername))
+    connect_args = {}
+
+    if url.drivername == "postgresql+asyncpg":
+        # asyncpg takes libpq's sslmode as its ssl argument and doesn't support channel_binding
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        query.pop("channel_binding", None)
+        url = url.set(query=query)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+
+    return url, connect_args
+
+
+database_url, connect_args = get_async_url(settings.DATABASE_URL)
+
 # Configure engine with optimal settings for Neon PostgreSQL
-engine = create_engine(
-    settings.DATABASE_URL,
+engine = create_async_engine(
+    database_url,
+    connect_args=connect_args,
     pool_size=20,  # connections maintained in pool
-    max_overflow=30,  # additional overflow connections
+    max_overflow=10,  # additional overflow connections (bounded to avoid fan-out under spikes)
+    pool_use_lifo=True,  # reuse the most recently returned connection to keep backends warm
     pool_pre_ping=True,  # verify connections before use
     pool_recycle=3600,  # recycle connections after 1 hour
     pool_timeout=30,  # wait time for connections
-    poolclass=QueuePool,
     echo=False  # set to True for debugging SQL queries
 )
 
+# Keep attributes loaded after commit so handlers can serialize without a refresh SELECT
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def upgrade_timestamp_columns(conn) -> None:
+    """Convert naive TIMESTAMP columns that the models declare as timezone-aware to timestamptz
+
+    create_all doesn't alter existing tables, and asyncpg rejects aware datetimes for
+    TIMESTAMP WITHOUT TIME ZONE columns. Stored values are naive UTC, so they're read AT TIME ZONE 'UTC'.
+    """
+    inspector = inspect(conn)
+    quote = conn.dialect.identifier_preparer.quote
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"]: column["type"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            current = existing.get(column.name)
+            if (
+                isinstance(column.type, DateTime) and column.type.timezone
+                and isinstance(current, DateTime) and not current.timezone
+            ):
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {quote(table.name)} ALTER COLUMN {quote(column.name)} "
+                    f"TYPE TIMESTAMP WITH TIME ZONE USING {quote(column.name)} AT TIME ZONE 'UTC'"
+                )
+
 
-def create_db_and_tables():
-    """Create database tables"""
-    SQLModel.metadata.create_all(engine)
+async def create_db_and_tables():
+    """Create database tables and bring existing timestamp columns up to date"""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        if conn.dialect.name == "postgresql":
+            await conn.run_sync(upgrade_timestamp_columns)
 
 
-def get_session() -> Generator[Session, None, None]:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session as a dependency for FastAPI"""
-    with Session(engine) as session:
+    async with async_session() as session:
         yield session
\ No newline at end of file
@@ -1,12 +1,10 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from sqlmodel import SQLModel
-from database import create_db_and_tables
+from datetime import datetime, timezone
+from database import create_db_and_tables, engine
 from models import user  # Import user model to register it with SQLModel metadata
-import routers.task
-import routers.user
-import routers.auth
 from routers.task import router as task_router
 from routers.user import router as user_router
 from routers.auth import router as auth_router
@@ -15,16 +13,18 @@ from routers.auth import router as auth_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create database tables on startup
-    create_db_and_tables()
+    await create_db_and_tables()
     yield
-    # Cleanup on shutdown if needed
+    # Close pooled connections, which are bound to this event loop
+    await engine.dispose()
 
 
 app = FastAPI(
     title="Task Management API",
     description="A complete task management system with CRUD operations and authentication",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serializes large task lists much faster than stdlib json
 )
 
 # Add CORS middleware
@@ -32,7 +32,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # In production, change this to your frontend domain
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
 )
 
@@ -47,9 +47,8 @@ def read_root():
     return {"message": "Task Management API", "status": "running"}
 
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 def health_check():
-    from datetime import datetime, timezone
     return {"status": "healthy", "timestamp": datetime.now(timezone.utc)}
 
 
@@ -1,4 +1,5 @@
-from sqlmodel import SQLModel, Field, Column
+from pydantic import field_validator
+from sqlmodel import SQLModel, Field, Column, DateTime, Index
 from typing import Optional
 from datetime import datetime, timezone
 from enum import Enum
@@ -21,15 +22,17 @@ class TaskBase(SQLModel):
     description: Optional[str] = Field(default=None, max_length=1000)
     status: TaskStatus = Field(default=TaskStatus.PENDING)
     priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
-    due_date: Optional[datetime] = Field(default=None)
+    due_date: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
 
 
 class Task(TaskBase, table=True):
     """Task database model"""
+    __table_args__ = (Index("ix_task_user_id_id", "user_id", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", nullable=False)  # Associate task with user
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), sa_type=DateTime(timezone=True), nullable=False)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), sa_type=DateTime(timezone=True), nullable=False)
 
 
 class TaskCreate(TaskBase):
@@ -51,4 +54,9 @@ class TaskResponse(TaskBase):
     id: int
     user_id: int  # Include user_id in response
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+    @field_validator('created_at', 'updated_at')
+    def assume_utc(cls, v):
+        # SQLite returns the stored timestamps without their offset; they were written as UTC
+        return v.replace(tzinfo=timezone.utc) if v.tzinfo is None else v
@@ -1,45 +1,36 @@
+import asyncio
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Annotated
 from database.database import get_session
 from models.user import User as UserModel
 from schemas.user import UserResponse
 from auth.auth import create_access_token, decode_token
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
+from auth.password import HASH_POOL, verify_password
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-def get_password_hasher():
-    """Configure pwdlib with Argon2 algorithm for secure password hashing"""
-    return PasswordHash([Argon2Hasher(
-        time_cost=3,
-        memory_cost=65536,
-        parallelism=1,
-        hash_len=32,
-        salt_len=16,
-    )])
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    ph = get_password_hasher()
-    return ph.verify(plain_password, hashed_password)
-
-def authenticate_user(email: str, password: str, db: Session) -> UserModel:
-    user = db.query(UserModel).filter(UserModel.email == email).first()
-    if not user or not verify_password(password, user.hashed_password):
+async def authenticate_user(email: str, password: str, db: AsyncSession) -> UserModel:
+    user = (await db.exec(select(UserModel).where(UserModel.email == email))).first()
+    if not user:
+        return None
+    # Verify in a worker thread so Argon2 doesn't block the event loop
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(HASH_POOL, verify_password, password, user.hashed_password):
         return None
     return user
 
 @router.post("/token")
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Session = Depends(get_session)
+    db: AsyncSession = Depends(get_session)
 ):
-    user = authenticate_user(form_data.username, form_data.password, db)
+    user = await authenticate_user(form_data.username, form_data.password, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,7 +40,13 @@ async def login_for_access_token(
 
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
-        data={"sub": user.email, "user_id": user.id},
+        data={
+            "sub": user.email,
+            "user_id": user.id,
+            "fn": user.first_name,
+            "ln": user.last_name,
+            "cat": user.created_at.isoformat(),
+        },
         expires_delta=access_token_expires
     )
 
@@ -59,7 +56,7 @@ async def login_for_access_token(
     }
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(token: str = Depends(oauth2_scheme), db: Session = Depends(get_session)):
+async def read_users_me(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_session)):
     payload = decode_token(token)
     if payload is None:
         raise HTTPException(
@@ -76,7 +73,7 @@ async def read_users_me(token: str = Depends(oauth2_scheme), db: Session = Depen
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(UserModel).filter(UserModel.email == email).first()
+    user = (await db.exec(select(UserModel).where(UserModel.email == email))).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
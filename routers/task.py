@@ -1,10 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Body, HTTPException, Depends, status
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List
 from datetime import datetime, timezone
 from database import get_session
 from models import Task, TaskCreate, TaskUpdate, TaskResponse
-from auth.dependencies import get_current_user
+from auth.dependencies import get_current_user, get_current_user_revalidated
+from models.user import User as UserModel
 from schemas.user import UserResponse
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
@@ -18,12 +22,39 @@ class TaskPriority:
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
-    
+
+# Built once at import; per-request values are supplied as bind parameters
+_TASK_LIST_STMT = (
+    select(Task)
+    .where(Task.user_id == bindparam("uid"))
+    .offset(bindparam("skip"))
+    .limit(bindparam("lim"))
+)
+_OWNED_TASK_STMT = select(Task).where(Task.id == bindparam("tid"), Task.user_id == bindparam("uid"))
+
+# Upper bound on tasks per batch request, keeping one transaction's size predictable
+MAX_BATCH_SIZE = 100
+
+
+async def _commit_new_tasks(session: AsyncSession) -> None:
+    """Commit inserted tasks, reporting a token whose user no longer exists as unauthorized"""
+    # Claims aren't rechecked against the database, so the user FK is what catches a deleted account
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task: TaskCreate,
     current_user: UserResponse = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> TaskResponse:
     """Create a new task"""
     # Create task instance manually to avoid conflicts with default_factory fields
@@ -40,47 +71,75 @@ async def create_task(
     )
 
     session.add(db_task)
-    session.commit()
-    session.refresh(db_task)
+    await _commit_new_tasks(session)
 
     return TaskResponse.model_validate(db_task)
 
 
+@router.post("/batch", response_model=List[TaskResponse], status_code=status.HTTP_201_CREATED)
+async def create_tasks_batch(
+    tasks: List[TaskCreate] = Body(min_length=1, max_length=MAX_BATCH_SIZE),
+    current_user: UserResponse = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session)
+) -> List[TaskResponse]:
+    """Create several tasks in a single transaction"""
+    utc_now = datetime.now(timezone.utc)
+    db_tasks = [
+        Task(
+            title=task.title,
+            description=task.description,
+            status=task.status if task.status else TaskStatus.PENDING,
+            priority=task.priority if task.priority else TaskPriority.MEDIUM,
+            due_date=task.due_date,
+            user_id=current_user.id,
+            created_at=utc_now,
+            updated_at=utc_now
+        )
+        for task in tasks
+    ]
+
+    session.add_all(db_tasks)
+    # Commit assigns the generated ids and expire_on_commit=False keeps them loaded, so no refresh is needed
+    await _commit_new_tasks(session)
+
+    return [TaskResponse.model_validate(db_task) for db_task in db_tasks]
+
+
 @router.get("/", response_model=List[TaskResponse])
 async def get_tasks(
     current_user: UserResponse = Depends(get_current_user),
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session)
-) -> List[TaskResponse]:
+    session: AsyncSession = Depends(get_session)
+) -> List[Task]:
     """Get a list of tasks for the authenticated user with pagination"""
-    statement = select(Task).where(Task.user_id == current_user.id).offset(skip).limit(limit)
-    tasks = session.exec(statement).all()
+    tasks = (await session.exec(
+        _TASK_LIST_STMT,
+        params={"uid": current_user.id, "skip": skip, "lim": limit}
+    )).all()
 
-    return [TaskResponse.model_validate(task) for task in tasks]
+    # Serialized in one pass by the route's response_model rather than validated row by row here
+    return tasks
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
     current_user: UserResponse = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> TaskResponse:
     """Get a specific task by ID"""
-    task = session.get(Task, task_id)
+    # Tasks owned by other users are reported as not found
+    task = (await session.exec(
+        _OWNED_TASK_STMT,
+        params={"tid": task_id, "uid": current_user.id}
+    )).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Check if the task belongs to the current user
-    if task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this task"
-        )
-
     return TaskResponse.model_validate(task)
 
 
@@ -89,32 +148,26 @@ async def update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> TaskResponse:
     """Update a task completely"""
-    db_task = session.get(Task, task_id)
+    # Update fields that are provided in a single UPDATE ... RETURNING round-trip
+    update_data = {field: getattr(task_update, field) for field in task_update.model_fields_set}
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user.id)
+        .values(**update_data, updated_at=datetime.now(timezone.utc))
+        .returning(Task)
+    )
+    db_task = (await session.exec(statement)).scalars().first()
+    # Tasks owned by other users are reported as not found
     if not db_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Check if the task belongs to the current user
-    if db_task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
-    # Update fields that are provided
-    update_data = task_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
-
-    db_task.updated_at = datetime.now(timezone.utc)
-    session.add(db_task)
-    session.commit()
-    session.refresh(db_task)
+    await session.commit()
 
     return TaskResponse.model_validate(db_task)
 
@@ -124,32 +177,26 @@ async def partial_update_task(
     task_id: int,
     task_update: TaskUpdate,
     current_user: UserResponse = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> TaskResponse:
     """Partially update a task"""
-    db_task = session.get(Task, task_id)
+    # Update only the fields that are provided in a single UPDATE ... RETURNING round-trip
+    update_data = {field: getattr(task_update, field) for field in task_update.model_fields_set}
+    statement = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == current_user.id)
+        .values(**update_data, updated_at=datetime.now(timezone.utc))
+        .returning(Task)
+    )
+    db_task = (await session.exec(statement)).scalars().first()
+    # Tasks owned by other users are reported as not found
     if not db_task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Check if the task belongs to the current user
-    if db_task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this task"
-        )
-
-    # Update only the fields that are provided
-    update_data = task_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
-
-    db_task.updated_at = datetime.now(timezone.utc)
-    session.add(db_task)
-    session.commit()
-    session.refresh(db_task)
+    await session.commit()
 
     return TaskResponse.model_validate(db_task)
 
@@ -157,25 +204,22 @@ async def partial_update_task(
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
-    current_user: UserResponse = Depends(get_current_user),
-    session: Session = Depends(get_session)
+    current_user: UserModel = Depends(get_current_user_revalidated),
+    session: AsyncSession = Depends(get_session)
 ):
     """Delete a task by ID"""
-    task = session.get(Task, task_id)
+    # Tasks owned by other users are reported as not found
+    task = (await session.exec(
+        _OWNED_TASK_STMT,
+        params={"tid": task_id, "uid": current_user.id}
+    )).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with id {task_id} not found"
         )
 
-    # Check if the task belongs to the current user
-    if task.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this task"
-        )
-
-    session.delete(task)
-    session.commit()
+    await session.delete(task)
+    await session.commit()
 
     return {"message": "Task deleted successfully"}
\ No newline at end of file
@@ -1,36 +1,19 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from database.database import get_session
 from models.user import User as UserModel
 from schemas.user import UserCreate, UserResponse
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
+from auth.password import HASH_POOL, hash_password
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-def get_password_hasher():
-    """Configure pwdlib with Argon2 algorithm for secure password hashing"""
-    return PasswordHash([Argon2Hasher(
-        time_cost=3,
-        memory_cost=65536,
-        parallelism=1,
-        hash_len=32,
-        salt_len=16,
-    )])
-
-def hash_password(plain_password: str):
-    ph = get_password_hasher()
-    return ph.hash(plain_password)
-
 @router.post("/signup", response_model=UserResponse, status_code=201)
-async def signup_user(user_create: UserCreate, db: Session = Depends(get_session)):
-    existing_user = db.query(UserModel).filter(UserModel.email == user_create.email).first()
-    if existing_user:
-        raise HTTPException(status_code=409, detail="Email already registered")
-
-    # Hash the password
-    hashed_password = hash_password(user_create.password)
+async def signup_user(user_create: UserCreate, db: AsyncSession = Depends(get_session)):
+    # Hash the password in a worker thread so Argon2 doesn't block the event loop
+    loop = asyncio.get_running_loop()
+    hashed_password = await loop.run_in_executor(HASH_POOL, hash_password, user_create.password)
 
     # Create user in database
     db_user = UserModel(
@@ -42,23 +25,12 @@ async def signup_user(user_create: UserCreate, db: Session = Depends(get_session
 
     try:
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
-
-        # Create response object separately to catch potential serialization errors
-        response = UserResponse(
-            id=db_user.id,
-            email=db_user.email,
-            first_name=db_user.first_name,
-            last_name=db_user.last_name,
-            created_at=db_user.created_at
-        )
-        return response
-
-    except Exception:
-        # Rollback the transaction if there's any error during response creation
-        db.rollback()
-        raise HTTPException(status_code=500, detail="Error occurred during user creation")
+        # id comes back from the INSERT and created_at is set in Python, so no refresh SELECT
+        await db.commit()
     except IntegrityError:
-        db.rollback()
-        raise HTTPException(status_code=409, detail="Email already registered")
\ No newline at end of file
+        # The unique index on users.email rejects duplicates, no pre-check SELECT needed
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Email already registered")
+
+    # Serialized once by the route's response_model
+    return db_user
\ No newline at end of file
@@ -1,8 +1,17 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+# Shared by every schema here; validate_assignment stays at pydantic's default (off)
+_MODEL_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra='ignore',
+    populate_by_name=True,
+    arbitrary_types_allowed=False,
+    str_strip_whitespace=True,
+)
+
 
 class TaskStatus(str, Enum):
     PENDING = "pending"
@@ -17,12 +26,16 @@ class TaskPriority(str, Enum):
 
 
 class TaskCreate(BaseModel):
+    model_config = _MODEL_CONFIG
+
     title: str
     description: Optional[str] = None
     priority: Optional[TaskPriority] = TaskPriority.MEDIUM
 
 
 class TaskUpdate(BaseModel):
+    model_config = _MODEL_CONFIG
+
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[TaskStatus] = None
@@ -31,6 +44,8 @@ class TaskUpdate(BaseModel):
 
 
 class TaskResponse(BaseModel):
+    model_config = _MODEL_CONFIG
+
     id: int
     title: str
     description: Optional[str]
@@ -1,43 +1,69 @@
-from pydantic import BaseModel, EmailStr, field_validator
-from typing import Optional
-from datetime import datetime
-import re
+from pydantic import BaseModel, ConfigDict, EmailStr, StringConstraints, field_validator
+from typing import Annotated, Optional
+from datetime import datetime, timezone
+import string
+
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+
+# Shared by every schema here; validate_assignment stays at pydantic's default (off)
+_MODEL_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra='ignore',
+    populate_by_name=True,
+    arbitrary_types_allowed=False,
+    str_strip_whitespace=True,
+)
 
 
 class UserBase(BaseModel):
+    model_config = _MODEL_CONFIG
+
     email: EmailStr
     first_name: Optional[str] = None
     last_name: Optional[str] = None
 
 
 class UserCreate(UserBase):
-    password: str
+    # Hashed exactly as typed, since login compares the unstripped form value
+    password: Annotated[str, StringConstraints(strip_whitespace=False)]
 
     @field_validator('password')
     def validate_password_strength(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
 
-        if not re.search(r'[A-Z]', v):
+        # Scan the password once and test each character class against the set
+        chars = set(v)
+
+        if chars.isdisjoint(_UPPERCASE):
             raise ValueError('Password must contain at least one uppercase letter')
 
-        if not re.search(r'[a-z]', v):
+        if chars.isdisjoint(_LOWERCASE):
             raise ValueError('Password must contain at least one lowercase letter')
 
-        if not re.search(r'\d', v):
+        if chars.isdisjoint(_DIGITS):
             raise ValueError('Password must contain at least one number')
 
         return v
 
 
 class UserUpdate(BaseModel):
+    model_config = _MODEL_CONFIG
+
     first_name: Optional[str] = None
     last_name: Optional[str] = None
 
 
 class UserResponse(UserBase):
+    # Emails were validated at signup; re-running email-validator on every response
+    # (and every token resolved by get_current_user) costs far more than the rest of the model
+    email: str
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    @field_validator('created_at')
+    def assume_utc(cls, v):
+        # SQLite returns the stored timestamp without its offset; it was written as UTC
+        return v.replace(tzinfo=timezone.utc) if v.tzinfo is None else v
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Cheap Argon2 parameters for the suite; must be set before the app reads its settings
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "8")
+os.environ.setdefault("ARGON2_PARALLELISM", "1")  # memory cost must be at least 8 KiB per lane
+
+from main import app
+from database import engine, create_db_and_tables, get_session
+
+
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+def enable_sqlite_savepoints(async_engine: AsyncEngine) -> None:
+    """Let SQLAlchemy emit BEGIN itself on SQLite so savepoints work inside the test transaction"""
+    # The sqlite driver otherwise manages transactions on its own and SAVEPOINT/ROLLBACK TO misbehave
+    sync_engine = async_engine.sync_engine
+    if sync_engine.dialect.name != "sqlite" or event.contains(sync_engine, "begin", _emit_begin):
+        return
+    event.listen(sync_engine, "connect", _disable_driver_transactions)
+    event.listen(sync_engine, "begin", _emit_begin)
+
+
+@pytest.fixture(scope="module")
+def db_engine():
+    """Engine the test transactions run on (modules with their own database override this)"""
+    enable_sqlite_savepoints(engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def _schema(db_engine):
+    """Create the database schema once per module"""
+    async def setup():
+        await create_db_and_tables()
+        # Release connections bound to this event loop before the test client starts its own
+        await db_engine.dispose()
+
+    asyncio.run(setup())
+    yield
+
+
+@pytest.fixture(scope="module")
+def test_client(_schema):
+    """Create a test client for the module, running the app lifespan once"""
+    # Per-test isolation comes from session_factory's rollback, not from a fresh client
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def session_factory(test_client, db_engine):
+    """Bind the app's sessions to one transaction that is rolled back after the test"""
+    connection = test_client.portal.call(db_engine.connect)
+    transaction = test_client.portal.call(connection.begin)
+
+    # Commits made by the handlers only release savepoints inside the outer transaction
+    def make_session() -> AsyncSession:
+        return AsyncSession(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False
+        )
+
+    async def get_test_session():
+        async with make_session() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    yield make_session
+
+    app.dependency_overrides.pop(get_session, None)
+    test_client.portal.call(transaction.rollback)
+    test_client.portal.call(connection.close)
@@ -1,21 +1,28 @@
+import pytest
 from fastapi.testclient import TestClient
 from main import app
 
-client = TestClient(app)
 
-def test_read_root():
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client keeps one event loop for the module, which the async engine's pool is bound to
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_read_root(client):
     response = client.get("/")
     print(response ,"/n response is printing ")
     assert response.status_code == 200
     assert response.json()== {"message":"Task Management API","status":"running"}
     
-def test_health_check():
+def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
     
 
-def test_create_task():
+def test_create_task(client):
     demo_task={
         "title":"Test task",
         "description":"this is a test task",
@@ -31,7 +38,7 @@ def test_create_task():
     assert data["status"] == demo_task["status"]
     assert data["priority"] == demo_task["priority"]
     
-def test_signup_user():
+def test_signup_user(client):
     demo_user={
         "email":"test1@gmail.com",
         "first_name":"Test",
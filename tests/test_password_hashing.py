@@ -0,0 +1,35 @@
+import time
+from argon2 import PasswordHasher
+from auth.password import PASSWORD_HASHER
+from database.config import Settings
+
+# Signup latency budget for one hash with the production parameters; a regression to a
+# slower backend or an accidental cost increase lands well above it
+HASH_BUDGET_SECONDS = 0.25
+
+
+def production_hasher():
+    """Build a hasher from the Settings defaults, ignoring the cheap parameters the suite runs with"""
+    return PasswordHasher(
+        time_cost=Settings.model_fields["ARGON2_TIME_COST"].get_default(call_default_factory=True),
+        memory_cost=Settings.model_fields["ARGON2_MEMORY_COST"].get_default(call_default_factory=True),
+        parallelism=Settings.model_fields["ARGON2_PARALLELISM"].get_default(call_default_factory=True),
+        hash_len=PASSWORD_HASHER.hash_len,
+        salt_len=PASSWORD_HASHER.salt_len,
+        type=PASSWORD_HASHER.type,
+    )
+
+
+def test_argon2_hash_stays_within_budget():
+    """Test that an Argon2 hash with the production parameters stays within the signup budget"""
+    hasher = production_hasher()
+
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        hashed = hasher.hash("ValidPass123")
+        timings.append(time.perf_counter() - start)
+
+    # The fastest run is the least disturbed by other load on the machine
+    assert min(timings) < HASH_BUDGET_SECONDS
+    assert hasher.verify(hashed, "ValidPass123")
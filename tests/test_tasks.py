@@ -3,19 +3,52 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from main import app
-from database import create_db_and_tables
+import hashlib
+from auth.auth import create_access_token
+from auth.dependencies import _TOKEN_CACHE, get_current_user, get_current_user_revalidated
 from models import TaskStatus, TaskPriority
+from database import engine
+from models.user import User
+from routers.task import MAX_BATCH_SIZE
+from schemas.user import UserResponse
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the API"""
-    create_db_and_tables()
-    with TestClient(app) as test_client:
-        yield test_client
+def client(test_client, session_factory):
+    """Create a test client authenticated as a test user, with its writes rolled back"""
+    async def create_test_user():
+        async with session_factory() as session:
+            user = User(email="tasks@example.com", hashed_password="not-a-real-hash")
+            session.add(user)
+            await session.commit()
+            return user
+
+    user = test_client.portal.call(create_test_user)
+    app.dependency_overrides[get_current_user] = lambda: UserResponse.model_validate(user, from_attributes=True)
+    app.dependency_overrides[get_current_user_revalidated] = lambda: user
+
+    yield test_client
+
+    app.dependency_overrides.pop(get_current_user, None)
+    app.dependency_overrides.pop(get_current_user_revalidated, None)
+
+
+def signup_and_login(client, email):
+    """Sign up a user through the API and return its id and bearer auth headers"""
+    credentials = {"email": email, "password": "ValidPass123"}
+    signup_response = client.post("/users/signup", json=credentials)
+    assert signup_response.status_code == 201
+
+    token_response = client.post(
+        "/auth/token",
+        data={"username": credentials["email"], "password": credentials["password"]}
+    )
+    assert token_response.status_code == 200
+
+    headers = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+    return signup_response.json()["id"], headers
 
 
 def test_create_task(client):
@@ -39,43 +72,73 @@ def test_create_task(client):
     assert "updated_at" in data
 
 
-@pytest.mark.parametrize("priority", ["low", "medium", "high"])
-def test_create_task_with_different_priorities(client, priority):
-    """Test creating tasks with different priorities"""
-    task_data = {
-        "title": f"Task with {priority} priority",
-        "description": f"Task with {priority} priority",
-        "priority": priority
-    }
+def test_create_task_with_different_priorities(client):
+    """Test creating tasks with every priority in one batch request"""
+    priorities = [priority.value for priority in TaskPriority]
+    tasks_data = [
+        {
+            "title": f"Task with {priority} priority",
+            "description": f"Task with {priority} priority",
+            "priority": priority
+        }
+        for priority in priorities
+    ]
 
-    response = client.post("/tasks/", json=task_data)
+    response = client.post("/tasks/batch", json=tasks_data)
     assert response.status_code == 201
 
     data = response.json()
-    assert data["priority"] == priority
+    assert [task["priority"] for task in data] == priorities
 
 
-@pytest.mark.parametrize("status", ["pending", "in_progress", "completed"])
-def test_create_task_with_different_statuses(client, status):
-    """Test creating tasks with different statuses by updating after creation"""
-    task_data = {
-        "title": f"Task with {status} status",
-        "description": f"Task with {status} status",
-        "priority": "medium"
-    }
+def test_create_task_with_different_statuses(client):
+    """Test moving tasks to every status by updating after a batch creation"""
+    statuses = [status.value for status in TaskStatus]
+    tasks_data = [
+        {
+            "title": f"Task with {status} status",
+            "description": f"Task with {status} status",
+            "priority": "medium"
+        }
+        for status in statuses
+    ]
 
-    response = client.post("/tasks/", json=task_data)
+    response = client.post("/tasks/batch", json=tasks_data)
     assert response.status_code == 201
 
-    task_id = response.json()["id"]
+    for task, status in zip(response.json(), statuses):
+        # Update the status
+        update_response = client.put(f"/tasks/{task['id']}", json={"status": status})
+        assert update_response.status_code == 200
+        assert update_response.json()["status"] == status
 
-    # Update the status
-    update_data = {"status": status}
-    update_response = client.put(f"/tasks/{task_id}", json=update_data)
-    assert update_response.status_code == 200
 
-    updated_data = update_response.json()
-    assert updated_data["status"] == status
+def test_create_tasks_batch(client):
+    """Test creating several tasks in one request"""
+    tasks_data = [
+        {"title": f"Batch Task {i}", "description": f"Batch task {i}", "priority": priority}
+        for i, priority in enumerate(["low", "medium", "high"])
+    ]
+
+    response = client.post("/tasks/batch", json=tasks_data)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert len(data) == 3
+    assert [task["title"] for task in data] == ["Batch Task 0", "Batch Task 1", "Batch Task 2"]
+    assert [task["priority"] for task in data] == ["low", "medium", "high"]
+    assert all(task["status"] == "pending" for task in data)
+    assert len({task["id"] for task in data}) == 3
+
+
+def test_create_tasks_batch_size_limits(client):
+    """Test that empty and oversized batches are rejected"""
+    response = client.post("/tasks/batch", json=[])
+    assert response.status_code == 422
+
+    tasks_data = [{"title": f"Batch Task {i}"} for i in range(MAX_BATCH_SIZE + 1)]
+    response = client.post("/tasks/batch", json=tasks_data)
+    assert response.status_code == 422
 
 
 def test_get_tasks(client):
@@ -366,7 +429,7 @@ def test_delete_task(client):
     assert get_response.status_code == 404
 
 
-def test_timestamps_consistency(client):
+def test_timestamps_consistency(client, monkeypatch):
     """Test that timestamps are properly set and updated"""
     # Create a task
     task_data = {
@@ -387,9 +450,15 @@ def test_timestamps_consistency(client):
 
     task_id = data["id"]
 
-    # Wait a moment and update the task
-    import time
-    time.sleep(0.01)  # Small delay to ensure timestamp difference
+    # Run the update a second later by advancing the router's clock instead of sleeping
+    later = datetime.now(timezone.utc) + timedelta(seconds=1)
+
+    class LaterDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return later
+
+    monkeypatch.setattr("routers.task.datetime", LaterDatetime)
 
     update_data = {
         "title": "Updated Timestamp Test Task"
@@ -484,4 +553,82 @@ def test_root_endpoint(client):
 
     data = response.json()
     assert data["message"] == "Task Management API"
-    assert data["status"] == "running"
\ No newline at end of file
+    assert data["status"] == "running"
+
+
+def test_auth_flow_with_bearer_token(test_client, session_factory):
+    """Test that a token issued at login authorizes the task routes"""
+    user_id, headers = signup_and_login(test_client, "flow@example.com")
+
+    assert test_client.get("/tasks/").status_code == 401
+
+    response = test_client.post("/tasks/", json={"title": "Token Task"}, headers=headers)
+    assert response.status_code == 201
+    task = response.json()
+    assert task["user_id"] == user_id
+
+    response = test_client.get("/tasks/", headers=headers)
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()] == [task["id"]]
+
+    response = test_client.delete(f"/tasks/{task['id']}", headers=headers)
+    assert response.status_code == 204
+
+    response = test_client.get(f"/tasks/{task['id']}", headers=headers)
+    assert response.status_code == 404
+
+
+def test_cached_user_is_rejected_after_token_expiry(test_client, session_factory):
+    """Test that a cached user is not served once its token has expired"""
+    user = UserResponse(id=1, email="expired@example.com", created_at=datetime.now())
+    token = create_access_token(
+        data={"sub": user.email, "user_id": user.id, "cat": user.created_at.isoformat()},
+        expires_delta=timedelta(seconds=-1)
+    )
+
+    # Entry cached while the token was still valid, and still within the cache TTL
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    _TOKEN_CACHE[key] = (user, datetime.now().timestamp() - 1)
+
+    response = test_client.get("/tasks/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert key not in _TOKEN_CACHE
+
+
+@pytest.mark.skipif(engine.dialect.name == "sqlite", reason="SQLite doesn't enforce foreign keys by default")
+def test_create_task_for_deleted_user(test_client, session_factory):
+    """Test that a still-valid token for a deleted user is rejected instead of failing the insert"""
+    user_id, headers = signup_and_login(test_client, "deleted@example.com")
+
+    async def delete_user():
+        async with session_factory() as session:
+            await session.delete(await session.get(User, user_id))
+            await session.commit()
+
+    test_client.portal.call(delete_user)
+
+    response = test_client.post("/tasks/", json={"title": "Orphan Task"}, headers=headers)
+    assert response.status_code == 401
+
+    response = test_client.post("/tasks/batch", json=[{"title": "Orphan Task"}], headers=headers)
+    assert response.status_code == 401
+
+
+def test_tasks_of_other_users_are_not_found(test_client, session_factory):
+    """Test that a user can't read, change or delete another user's task"""
+    _, owner_headers = signup_and_login(test_client, "owner@example.com")
+    _, other_headers = signup_and_login(test_client, "other@example.com")
+
+    response = test_client.post("/tasks/", json={"title": "Private Task"}, headers=owner_headers)
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    assert test_client.get(f"/tasks/{task_id}", headers=other_headers).status_code == 404
+    assert test_client.put(f"/tasks/{task_id}", json={"title": "Taken"}, headers=other_headers).status_code == 404
+    assert test_client.patch(f"/tasks/{task_id}", json={"title": "Taken"}, headers=other_headers).status_code == 404
+    assert test_client.delete(f"/tasks/{task_id}", headers=other_headers).status_code == 404
+    assert test_client.get("/tasks/", headers=other_headers).json() == []
+
+    response = test_client.get(f"/tasks/{task_id}", headers=owner_headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Private Task"
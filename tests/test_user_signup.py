@@ -1,47 +1,55 @@
+import asyncio
 import pytest
-from fastapi.testclient import TestClient
 from fastapi import HTTPException
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
-from main import app
-from database.database import get_session
 from models.user import User
-from pwdlib import PasswordHash
-from pwdlib.hashers.argon2 import Argon2Hasher
+from argon2 import PasswordHasher
+from tests.conftest import enable_sqlite_savepoints
 
 
 # Create an in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-engine = create_engine(
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
-@pytest.fixture(scope="function")
-def client():
-    """Create a test client with a clean database for each test function"""
-    # Create tables
-    SQLModel.metadata.create_all(bind=engine)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
 
-    def get_test_session():
-        with TestingSessionLocal() as session:
-            yield session
 
-    app.dependency_overrides[get_session] = get_test_session
+async def get_user(session_factory, user_id):
+    # Read through the test transaction, where the signup's changes are visible
+    async with session_factory() as session:
+        return await session.get(User, user_id)
 
-    with TestClient(app) as test_client:
-        yield test_client
 
-    # Clean up
-    app.dependency_overrides.clear()
-    # Drop all tables to ensure clean state for next test
-    SQLModel.metadata.drop_all(bind=engine)
+@pytest.fixture(scope="module")
+def db_engine():
+    """Run this module's test transactions on the in-memory database"""
+    enable_sqlite_savepoints(engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def _schema(db_engine):
+    """Create the tables once; StaticPool keeps the in-memory database alive across tests"""
+    asyncio.run(create_tables())
+    yield
+    # Closing the single pooled connection also stops aiosqlite's worker thread
+    asyncio.run(db_engine.dispose())
+
+
+@pytest.fixture
+def client(test_client, session_factory):
+    """Create a test client whose database changes are rolled back after each test"""
+    return test_client
 
 
 @pytest.fixture
@@ -55,7 +63,7 @@ def valid_user_data():
     }
 
 
-def test_successful_user_signup(client, valid_user_data):
+def test_successful_user_signup(client, session_factory, valid_user_data):
     """Test successful user signup"""
     response = client.post("/users/signup", json=valid_user_data)
 
@@ -68,18 +76,18 @@ def test_successful_user_signup(client, valid_user_data):
     assert data["first_name"] == valid_user_data["first_name"]
     assert data["last_name"] == valid_user_data["last_name"]
     assert "created_at" in data
+    assert "hashed_password" not in data
 
     # Verify the user was actually created in the database
-    with TestingSessionLocal() as session:
-        user = session.get(User, data["id"])
-        assert user is not None
-        assert user.email == valid_user_data["email"]
-        assert user.first_name == valid_user_data["first_name"]
-        assert user.last_name == valid_user_data["last_name"]
+    user = client.portal.call(get_user, session_factory, data["id"])
+    assert user is not None
+    assert user.email == valid_user_data["email"]
+    assert user.first_name == valid_user_data["first_name"]
+    assert user.last_name == valid_user_data["last_name"]
 
-        # Verify the password was hashed
-        ph = PasswordHash([Argon2Hasher()])
-        assert ph.verify(valid_user_data["password"], user.hashed_password)
+    # Verify the password was hashed
+    ph = PasswordHasher()
+    assert ph.verify(user.hashed_password, valid_user_data["password"])
 
 
 def test_duplicate_email_signup(client, valid_user_data):
@@ -190,4 +198,15 @@ def test_signup_with_empty_optional_fields(client, valid_user_data):
 
     assert data["email"] == data_with_empty_optional["email"]
     assert data["first_name"] == ""
-    assert data["last_name"] == ""
\ No newline at end of file
+    assert data["last_name"] == ""
+
+def test_signup_strips_names_but_not_password(client, valid_user_data):
+    """Test that surrounding whitespace is stripped from names but kept in the password"""
+    padded_data = {**valid_user_data, "first_name": "  Test ", "password": " ValidPass123 "}
+
+    response = client.post("/users/signup", json=padded_data)
+    assert response.status_code == 201
+    assert response.json()["first_name"] == "Test"
+
+    login_data = {"username": padded_data["email"], "password": padded_data["password"]}
+    assert client.post("/auth/token", data=login_data).status_code == 200